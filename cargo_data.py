@@ -0,0 +1,49 @@
+import numpy as np
+
+__all__ = [
+    'AIRPORTS', 'DAYS', 'T', 'DEFAULT_DEMAND', 'ROUTES', 'COST_REPO', 'COST_HOLD',
+    'AIRPORT_IDX', 'ROUTE_IDX', 'demand_to_array', 'DEMAND_ARR', 'COST_REPO_ARR',
+]
+
+# --- Data ---
+AIRPORTS = ['A', 'B', 'C']
+DAYS = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri']
+T = len(DAYS)
+
+# Demand: D[i][j][day_idx]
+DEFAULT_DEMAND = {
+    ('A', 'B'): [100, 200, 100, 400, 300],
+    ('A', 'C'): [ 50,  50,  50,  50,  50],
+    ('B', 'A'): [ 25,  25,  25,  25,  25],
+    ('B', 'C'): [ 25,  25,  25,  25,  25],
+    ('C', 'A'): [ 40,  40,  40,  40,  40],
+    ('C', 'B'): [400, 200, 300, 200, 400],
+}
+
+ROUTES = [(i, j) for i in AIRPORTS for j in AIRPORTS if i != j]
+
+COST_REPO = {
+    ('A', 'B'): 7, ('B', 'A'): 7,
+    ('A', 'C'): 3, ('C', 'A'): 3,
+    ('B', 'C'): 6, ('C', 'B'): 6
+}
+
+COST_HOLD = 10
+
+AIRPORT_IDX = {a: k for k, a in enumerate(AIRPORTS)}
+ROUTE_IDX = {r: k for k, r in enumerate(ROUTES)}
+
+def demand_to_array(demand):
+    """
+    Converts a demand dict {(i, j): [per-day loads]} into a dense
+    (len(AIRPORTS), len(AIRPORTS), T) int32 array indexed via AIRPORT_IDX.
+    """
+    arr = np.zeros((len(AIRPORTS), len(AIRPORTS), T), dtype=np.int32)
+    for (i, j), d_vals in demand.items():
+        arr[AIRPORT_IDX[i], AIRPORT_IDX[j]] = d_vals
+    return arr
+
+# Dense copies of the data above, indexed [origin, dest(, day)] via AIRPORT_IDX
+DEMAND_ARR = demand_to_array(DEFAULT_DEMAND)
+COST_REPO_ARR = np.zeros((len(AIRPORTS), len(AIRPORTS)), dtype=np.int32)
+COST_REPO_ARR[[AIRPORT_IDX[i] for i, _ in COST_REPO], [AIRPORT_IDX[j] for _, j in COST_REPO]] = list(COST_REPO.values())
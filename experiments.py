@@ -1,5 +1,93 @@
-import copy
-from solver import solve_cargo_operations, DEFAULT_DEMAND
+import argparse
+import contextlib
+import hashlib
+import io
+import os
+import pickle
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+import gurobipy
+from cargo_data import DEFAULT_DEMAND
+from solver import (build_model, load_model, solve_fleet_sweep, solve_with_fleet,
+                    solve_cargo_operations, write_model_template)
+
+# 3 workers x 2 threads stays within the licensed cores
+MAX_WORKERS = 3
+SOLVER_THREADS = 2
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".solve_cache")
+
+# Only set for --parallel runs (see _init_parallel): an MPS file from
+# write_model_template() that single solves load instead of rebuilding the
+# model in Python, and whether solves are shared through the disk cache
+MODEL_TEMPLATE = None
+USE_DISK_CACHE = False
+
+def _init_parallel(template):
+    # Also the pool initializer; _init_parallel(None) turns both off again
+    global MODEL_TEMPLATE, USE_DISK_CACHE
+    MODEL_TEMPLATE = template
+    USE_DISK_CACHE = template is not None
+
+# In-process memo (in front of the disk cache in --parallel runs), keyed by (fleet_size, demand_key)
+_solve_cache = {}
+
+def _demand_key(demand):
+    return tuple((k, tuple(v)) for k, v in sorted(demand.items()))
+
+def _source_digest():
+    # The solver and data sources and the Gurobi version are part of the
+    # cache key, so changing any of them invalidates the cache
+    digest = hashlib.sha1(gurobipy.__version__.encode())
+    for name in ("solver.py", "cargo_data.py"):
+        with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), name), "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+_SOURCE_DIGEST = _source_digest()
+
+def _cache_path(fleet_size, demand_key):
+    # hash() of strings is salted per process, so use a stable digest instead
+    key = repr((_SOURCE_DIGEST, SOLVER_THREADS, fleet_size, demand_key))
+    digest = hashlib.sha1(key.encode()).hexdigest()
+    return os.path.join(CACHE_DIR, f"{fleet_size}_{digest}.pkl")
+
+def cached_solve(fleet_size, demand_override=None):
+    """
+    solve_cargo_operations() memoized in memory, so identical solves (e.g.
+    the Fleet=1200 baseline of Experiments 2 and 3) run once. In --parallel
+    runs it is also backed by an on-disk pickle cache shared by the workers.
+    Returns a copy callers may mutate.
+    """
+    key = (fleet_size, _demand_key(demand_override or DEFAULT_DEMAND))
+    if key not in _solve_cache:
+        if USE_DISK_CACHE:
+            _solve_cache[key] = _disk_cached_solve(fleet_size, demand_override, key[1])
+        else:
+            _solve_cache[key] = _solve(fleet_size, demand_override)
+    # Results are flat dicts of numbers (or None), so a shallow copy is enough
+    res = _solve_cache[key]
+    return dict(res) if res is not None else None
+
+def _disk_cached_solve(fleet_size, demand_override, demand_key):
+    path = _cache_path(fleet_size, demand_key)
+    if os.path.exists(path):
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    res = _solve(fleet_size, demand_override)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump(res, f)
+    os.replace(tmp_path, path)
+    return res
+
+def _solve(fleet_size, demand_override):
+    if MODEL_TEMPLATE and (demand_override is None or demand_override.keys() == DEFAULT_DEMAND.keys()):
+        model, variables, fleet_constrs = load_model(MODEL_TEMPLATE, demand_override, verbose=False,
+                                                     fleet_size=fleet_size, threads=SOLVER_THREADS)
+        return solve_with_fleet(model, variables, fleet_constrs, fleet_size, verbose=False)
+    return solve_cargo_operations(fleet_size=fleet_size, demand_override=demand_override,
+                                  verbose=False, threads=SOLVER_THREADS)
 
 def run_fleet_experiments():
     print("\n=== Experiment 1: Fleet Size Sensitivity ===")
@@ -8,8 +96,11 @@ def run_fleet_experiments():
     fleet_sizes = range(1150, 1451, 50)
     results = []
     
-    for fs in fleet_sizes:
-        res = solve_cargo_operations(fleet_size=fs, verbose=False)
+    # Build once, then re-solve each fleet size from the previous optimal basis
+    model, variables, fleet_constrs = build_model(DEFAULT_DEMAND, verbose=False, threads=SOLVER_THREADS)
+    sweep_results = solve_fleet_sweep(model, variables, fleet_constrs, fleet_sizes)
+    
+    for fs, res in zip(fleet_sizes, sweep_results):
         if res:
             print(f"{fs:<12} {res['Total Cost']:<12.0f} {res['Repo Cost']:<12.0f} {res['Hold Cost']:<12.0f} {res['Backlog Days']:<12.0f}")
             results.append((fs, res))
@@ -24,7 +115,8 @@ def run_demand_experiments():
     # Note: Fri backlog (190) + Mon demand (100) = 290. 
     # Bottleneck is fleet.
     
-    modified_demand = copy.deepcopy(DEFAULT_DEMAND)
+    # Copy only the list we change; the other routes share DEFAULT_DEMAND's lists
+    modified_demand = {k: (v.copy() if k == ('A', 'B') else v) for k, v in DEFAULT_DEMAND.items()}
     # A->B demand
     # Mon: 100 -> 50
     # Wed: 100 -> 150
@@ -32,11 +124,11 @@ def run_demand_experiments():
     modified_demand[('A', 'B')][2] += 50
     
     print("\n-- Baseline (Fleet=1200) --")
-    base = solve_cargo_operations(fleet_size=1200, verbose=False)
+    base = cached_solve(1200)
     print(f"Cost: {base['Total Cost']}, Backlog Days: {base['Backlog Days']}")
     
     print("\n-- Smoothed Demand (Fleet=1200) --")
-    smooth = solve_cargo_operations(fleet_size=1200, demand_override=modified_demand, verbose=False)
+    smooth = cached_solve(1200, modified_demand)
     
     if smooth:
         print(f"Cost: {smooth['Total Cost']}, Backlog Days: {smooth['Backlog Days']}")
@@ -49,17 +141,17 @@ def run_route_balance_experiments():
     print("\n=== Experiment 3: Route Balancing (Utilization of Empty Legs) ===")
     print("Monday has 275 empty flights from B->A. Testing impact of adding 200 loads of new demand to B->A on Monday.")
     
-    modified_demand = copy.deepcopy(DEFAULT_DEMAND)
+    modified_demand = {k: (v.copy() if k == ('B', 'A') else v) for k, v in DEFAULT_DEMAND.items()}
     # B->A original: [25, 25, 25, 25, 25]
     # Add 200 to Monday
     modified_demand[('B', 'A')][0] += 200
     
     print("\n-- Baseline (Fleet=1200) --")
-    base = solve_cargo_operations(fleet_size=1200, verbose=False)
+    base = cached_solve(1200)
     print(f"Total Cost: {base['Total Cost']}, Repo Cost: {base['Repo Cost']}")
     
     print("\n-- Increased B->A Demand (+200 on Mon) --")
-    new_scenario = solve_cargo_operations(fleet_size=1200, demand_override=modified_demand, verbose=False)
+    new_scenario = cached_solve(1200, modified_demand)
     
     if new_scenario:
         print(f"Total Cost: {new_scenario['Total Cost']}, Repo Cost: {new_scenario['Repo Cost']}")
@@ -70,7 +162,43 @@ def run_route_balance_experiments():
     else:
         print("Infeasible.")
 
+def _run_captured(experiment):
+    # Buffer each worker's report so the experiments print in order
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        experiment()
+    return buf.getvalue()
+
+def _run_parallel(experiments):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # Build the model once in Python; workers read it back from MPS
+        template = os.path.join(tmp_dir, "cargo.mps")
+        write_model_template(template)
+        _init_parallel(template)
+        try:
+            # Solve the shared baseline up front so both workers hit the cache
+            cached_solve(1200)
+            
+            with ProcessPoolExecutor(max_workers=MAX_WORKERS, initializer=_init_parallel,
+                                     initargs=(template,)) as pool:
+                futures = [pool.submit(_run_captured, exp) for exp in experiments]
+                for future in futures:
+                    print(future.result(), end="")
+        finally:
+            # The template is deleted with tmp_dir, so later solves must rebuild
+            _init_parallel(None)
+
 if __name__ == "__main__":
-    run_fleet_experiments()
-    run_demand_experiments()
-    run_route_balance_experiments()
+    parser = argparse.ArgumentParser()
+    # Each solve of the default instance takes well under a millisecond, so
+    # starting workers costs more than it saves; use this for larger instances
+    parser.add_argument("--parallel", action="store_true",
+                        help="run the experiments in a process pool")
+    args = parser.parse_args()
+    
+    experiments = [run_fleet_experiments, run_demand_experiments, run_route_balance_experiments]
+    if args.parallel:
+        _run_parallel(experiments)
+    else:
+        for experiment in experiments:
+            experiment()
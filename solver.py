@@ -1,137 +1,584 @@
+import atexit
+import os
+import numpy as np
+from scipy import sparse
 from gurobipy import *
-# --- Data ---
-AIRPORTS = ['A', 'B', 'C']
-DAYS = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri']
-T = len(DAYS)
-
-# Demand: D[i][j][day_idx]
-DEFAULT_DEMAND = {
-    ('A', 'B'): [100, 200, 100, 400, 300],
-    ('A', 'C'): [ 50,  50,  50,  50,  50],
-    ('B', 'A'): [ 25,  25,  25,  25,  25],
-    ('B', 'C'): [ 25,  25,  25,  25,  25],
-    ('C', 'A'): [ 40,  40,  40,  40,  40],
-    ('C', 'B'): [400, 200, 300, 200, 400],
-}
+from cargo_data import *
+
+# Index arrays reused by every constraint-matrix build
+_ROUTE_ORIG = np.array([AIRPORT_IDX[i] for i, _ in ROUTES], dtype=np.int32)
+_ROUTE_DEST = np.array([AIRPORT_IDX[j] for _, j in ROUTES], dtype=np.int32)
+_DAYS_IDX = np.arange(T, dtype=np.int32)
+_NEXT_DAY = (_DAYS_IDX + 1) % T
+_ROUTE_COST = COST_REPO_ARR[_ROUTE_ORIG, _ROUTE_DEST]
+# (route/airport, day) -> offset within its column block, and the flow
+# balance rows a flight (or idle aircraft) leaves from and arrives at
+_ROUTE_COLS = np.add.outer(np.arange(len(ROUTES), dtype=np.int32) * T, _DAYS_IDX)
+_AIRPORT_COLS = np.add.outer(np.arange(len(AIRPORTS), dtype=np.int32) * T, _DAYS_IDX)
+_DEPART_ROWS = np.add.outer(_ROUTE_ORIG * T, _DAYS_IDX)
+_ARRIVE_ROWS = np.add.outer(_ROUTE_DEST * T, _NEXT_DAY)
+_IDLE_NEXT_ROWS = np.add.outer(np.arange(len(AIRPORTS), dtype=np.int32) * T, _NEXT_DAY)
+_ROUTE_DAY_KEYS = [(i, j, t) for i, j in ROUTES for t in range(T)]
+_AIRPORT_DAY_KEYS = [(i, t) for i in AIRPORTS for t in range(T)]
 
-ROUTES = [(i, j) for i in AIRPORTS for j in AIRPORTS if i != j]
+# Days an aircraft needs to fly a route and come back, used to estimate how
+# much daily demand a route can always be served without backlog
+AVG_CYCLE_DAYS = 2
 
-COST_REPO = {
-    ('A', 'B'): 7, ('B', 'A'): 7,
-    ('A', 'C'): 3, ('C', 'A'): 3,
-    ('B', 'C'): 6, ('C', 'B'): 6
+# Solver settings for this small, flow-structured model: light presolve,
+# dual simplex for the LP relaxations, and no extra heuristics/cut effort.
+# See cargo_tuned.prm for the output of tune_cargo_model().
+DEFAULT_PARAMS = {
+    'Presolve': 1,
+    'Method': 1,
+    'MIPFocus': 1,
+    'Heuristics': 0,
+    'Cuts': 1,
 }
 
-COST_HOLD = 10
+# Shared Gurobi environment, started lazily once per process. Starting an
+# Env checks the license, which costs more than building this small model.
+# Output is toggled per model via OutputFlag, so one Env serves both modes.
+# Envs are not fork-safe, so a forked child (e.g. a pool worker) that
+# inherits the parent's Env starts its own instead; _ENV_PID tracks the owner.
+_ENV = None
+_ENV_PID = None
 
-def solve_cargo_operations(fleet_size=1200, demand_override=None, verbose=True):
+def _get_env():
+    global _ENV, _ENV_PID
+    if _ENV is None or _ENV_PID != os.getpid():
+        _ENV = Env(empty=True)
+        _ENV.setParam('OutputFlag', 0)
+        _ENV.start()
+        _ENV_PID = os.getpid()
+        atexit.register(_ENV.dispose)
+    return _ENV
+
+def build_model(demand=None, verbose=True, fleet_size=1200, threads=None, params=None):
     """
-    Solves the Cargo Operations problem.
+    Builds the Cargo Operations model without solving it.
     
     Args:
-        fleet_size (int): Total number of aircraft.
-        demand_override (dict): Optional replacement for DEFAULT_DEMAND.
-        verbose (bool): Whether to print solution details.
+        demand (dict): Optional replacement for DEFAULT_DEMAND.
+        verbose (bool): Whether Gurobi should print solver output.
+        fleet_size (int): Initial right-hand side of the fleet size constraints.
+        threads (int): Optional cap on Gurobi threads (e.g. when running in a process pool).
+        params (dict): Gurobi parameters overriding DEFAULT_PARAMS.
         
     Returns:
-        dict: Summary metrics (Cost, RepoCost, HoldCost, TotalShipped, BacklogDays) or None if infeasible.
+        tuple: (model, variables, fleet_constrs). `variables` maps names to the
+        decision variables; `fleet_constrs` holds the
+        FleetSize_* constraints whose RHS can be changed between solves.
     """
-    demand = demand_override if demand_override else DEFAULT_DEMAND
+    demand = demand if demand else DEFAULT_DEMAND
     
     # --- Model ---
-    env = Env(empty=True)
-    if not verbose:
-        env.setParam('OutputFlag', 0)
-    else:
-        env.setParam('OutputFlag', 1)
-    env.start()
-    
-    myModel = Model("CargoOperations", env=env)
+    myModel = Model("CargoOperations", env=_get_env())
+    _configure_model(myModel, verbose, threads, params)
 
     # --- Variables ---
-    x = myModel.addVars(ROUTES, range(T), vtype=GRB.INTEGER, name="x")
-    y = myModel.addVars(ROUTES, range(T), vtype=GRB.INTEGER, name="y")
-    I = myModel.addVars(AIRPORTS, range(T), vtype=GRB.INTEGER, name="I")
-    H = myModel.addVars(demand.keys(), range(T), vtype=GRB.INTEGER, name="H")
+    # Declared continuous: the aircraft and cargo balance rows are network-flow
+    # incidence rows with integer RHS, so the LP optimum is almost always an
+    # integral vertex and no branch-and-bound is needed. The FleetSize_* side
+    # constraints break total unimodularity, though, so a fractional LP
+    # solution is possible; _ensure_integral() then re-solves as a MIP.
+    c, A, b, _ = _build_matrix_problem(demand, fleet_size)
+    v = myModel.addMVar(len(c), lb=0, vtype=GRB.CONTINUOUS)
 
     # --- Objective ---
-    obj_repo = quicksum(COST_REPO[i,j] * y[i,j,t] for i,j in ROUTES for t in range(T))
-    obj_hold = quicksum(COST_HOLD * H[i,j,t] for (i,j) in demand.keys() for t in range(T))
-    myModel.setObjective(obj_repo + obj_hold, GRB.MINIMIZE)
+    myModel.setObjective(c @ v, GRB.MINIMIZE)
 
     # --- Constraints ---
-    def prev(t):
-        return (t - 1) % T
-
-    # 1. Aircraft Flow Balance
-    for i in AIRPORTS:
-        for t in range(T):
-            inbound = quicksum(x[j, i, prev(t)] + y[j, i, prev(t)] for j in AIRPORTS if j != i)
-            prev_inv = I[i, prev(t)]
-            outbound = quicksum(x[i, j, t] + y[i, j, t] for j in AIRPORTS if j != i)
-            curr_inv = I[i, t]
-            myModel.addConstr(inbound + prev_inv == outbound + curr_inv, name=f"FlowBal_Air_{i}_{DAYS[t]}")
-
-    # 2. Cargo Flow Balance
-    for (i, j), d_vals in demand.items():
-        for t in range(T):
-            backlog_prev = H[i, j, prev(t)]
-            new_demand = d_vals[t]
-            shipped = x[i, j, t]
-            backlog_curr = H[i, j, t]
-            myModel.addConstr(backlog_prev + new_demand == shipped + backlog_curr, name=f"FlowBal_Cargo_{i}_{j}_{DAYS[t]}")
-
-    # 3. Fleet Size
-    for t in range(T):
-        total_in_air = quicksum(x[i, j, t] + y[i, j, t] for i, j in ROUTES)
-        total_on_ground = quicksum(I[i, t] for i in AIRPORTS)
-        myModel.addConstr(total_in_air + total_on_ground == fleet_size, name=f"FleetSize_{DAYS[t]}")
+    # Aircraft flow balance, cargo flow balance and fleet size, in one call
+    constrs = myModel.addMConstr(A, v, '=', b, name=_row_names(demand))
+    fleet_constrs = constrs.tolist()[-T:]
+
+    variables = _variable_views(v.tolist(), _column_keys(demand))
+    # Solver state lives on the model (gurobipy allows _ attributes) so the
+    # variables dict handed back to callers is never mutated
+    myModel._demand = demand
+    myModel._fixed_H = []
+    _fix_unbottlenecked_backlog(myModel, variables, fleet_size)
+    return myModel, variables, fleet_constrs
+
+def _fix_unbottlenecked_backlog(myModel, variables, fleet_size):
+    """
+    Fixes H to 0 (ub=0) on routes whose daily demand never exceeds a
+    conservative per-route share of the fleet, so presolve can drop them.
+    
+    This is a guess, not a proof: _release_backlog_fixings() checks the
+    reduced costs after each solve and lifts the bounds if it was wrong.
+    Fixings made for a previous fleet size are lifted first.
+    """
+    previous = myModel._fixed_H
+    myModel.setAttr('UB', previous, [GRB.INFINITY] * len(previous))
+    daily_cap_estimate = fleet_size / (len(ROUTES) * AVG_CYCLE_DAYS)
+    H = variables["H"]
+    fixed = [H[i, j, t] for (i, j), d_vals in myModel._demand.items()
+             if max(d_vals) <= daily_cap_estimate for t in range(T)]
+    myModel.setAttr('UB', fixed, [0] * len(fixed))
+    myModel._fixed_H = fixed
+
+def _release_backlog_fixings(myModel, force=False):
+    """
+    Lifts the ub=0 fixings from _fix_unbottlenecked_backlog() and re-solves
+    unless the current LP optimum is provably optimal without them, i.e.
+    no fixed H has a negative reduced cost.
+    """
+    fixed = myModel._fixed_H
+    if not fixed:
+        return
+    if not force and myModel.status == GRB.OPTIMAL and not myModel.IsMIP:
+        if min(myModel.getAttr('RC', fixed)) >= -1e-9:
+            return
+    myModel.setAttr('UB', fixed, [GRB.INFINITY] * len(fixed))
+    myModel._fixed_H = []
+    if not force:
+        myModel.optimize()
+
+def _configure_model(myModel, verbose, threads, params):
+    myModel.Params.OutputFlag = 1 if verbose else 0
+    if threads:
+        myModel.Params.Threads = threads
+    for name, value in {**DEFAULT_PARAMS, **(params or {})}.items():
+        myModel.setParam(name, value)
+    # Keep the previous basis when re-solving after an RHS change
+    myModel.Params.LPWarmStart = 2
+
+def _variable_views(var_list, column_keys):
+    # Keyed views over the columns, e.g. x[i, j, t] and I[i, t]
+    variables = {}
+    offset = 0
+    for name, keys in column_keys.items():
+        variables[name] = tupledict(zip(keys, var_list[offset:offset + len(keys)]))
+        offset += len(keys)
+    return variables
+
+def write_model_template(path, demand=None):
+    """
+    Writes the model from build_model() to `path` (e.g. an .mps file) so
+    other processes can load it with load_model() instead of rebuilding it.
+    """
+    myModel, _, _ = build_model(demand, verbose=False)
+    myModel.write(path)
+
+def load_model(path, demand=None, verbose=True, fleet_size=1200, threads=None, params=None):
+    """
+    Reads a model written by write_model_template() and sets the demand and
+    fleet size RHS by constraint name. Takes the same arguments and returns
+    the same tuple as build_model().
+    
+    The demand must cover the same routes as the demand the template was
+    written with; only the per-day loads may differ.
+    """
+    demand = demand if demand else DEFAULT_DEMAND
+
+    myModel = read(path, env=_get_env())
+    _configure_model(myModel, verbose, threads, params)
+    constrs = myModel.getConstrs()
+
+    # Cargo rows are in H column order, so their names give the H keys
+    cargo_rows = constrs[len(AIRPORTS) * T:-T]
+    name_to_key = {f"FlowBal_Cargo_{i}_{j}_{DAYS[t]}": (i, j, t) for i, j in demand for t in range(T)}
+    if len(cargo_rows) != len(name_to_key):
+        raise ValueError(f"{path} was written for a different set of demand routes")
+    try:
+        h_keys = [name_to_key[c.ConstrName] for c in cargo_rows]
+    except KeyError:
+        raise ValueError(f"{path} was written for a different set of demand routes") from None
+    myModel.setAttr('RHS', cargo_rows, [demand[i, j][t] for i, j, t in h_keys])
+
+    fleet_constrs = constrs[-T:]
+    myModel.setAttr('RHS', fleet_constrs, [fleet_size] * T)
+
+    column_keys = _column_keys(demand)
+    column_keys["H"] = h_keys
+    variables = _variable_views(myModel.getVars(), column_keys)
+    myModel._demand = demand
+    # The template carries the fixings for its own demand; redo them for ours
+    myModel._fixed_H = list(variables["H"].values())
+    _fix_unbottlenecked_backlog(myModel, variables, fleet_size)
+    return myModel, variables, fleet_constrs
+
+def _set_fleet_size(myModel, variables, fleet_constrs, fleet_size):
+    # The H fixings depend on the fleet size, so redo them with the RHS.
+    # A MIP keeps none (see _ensure_integral()).
+    for c in fleet_constrs:
+        c.RHS = fleet_size
+    if not myModel.IsMIP:
+        _fix_unbottlenecked_backlog(myModel, variables, fleet_size)
+
+def solve_with_fleet(myModel, variables, fleet_constrs, fleet_size, verbose=True):
+    """
+    Re-solves a model from build_model() for a new fleet size.
+    
+    Only the RHS of the FleetSize_* constraints is changed, so the model
+    structure (and Gurobi's previous basis) is reused.
+    
+    Returns:
+        dict: Summary metrics (see solve_cargo_operations) or None if infeasible.
+    """
+    _set_fleet_size(myModel, variables, fleet_constrs, fleet_size)
 
     # --- Solve ---
     myModel.optimize()
+    _release_backlog_fixings(myModel)
+    _ensure_integral(myModel, variables)
+
+    return _collect_results(myModel, variables, verbose)
+
+def solve_fleet_sweep(myModel, variables, fleet_constrs, fleet_sizes):
+    """
+    Solves a model from build_model() for each fleet size in turn, seeding
+    every solve with the optimal basis of the previous one.
+    
+    Only the FleetSize_* RHS changes between solves, so the previous basis
+    stays dual feasible and dual simplex needs just a few pivots. Bases are
+    only carried over while the model is an LP (see _ensure_integral()).
+    
+    Returns:
+        list: One summary dict (without printing) per fleet size, or None for
+        fleet sizes that are infeasible.
+    """
+    all_vars = myModel.getVars()
+    all_constrs = myModel.getConstrs()
+    basis = None
+
+    results = []
+    fleet_sizes = list(fleet_sizes)
+    for k, fs in enumerate(fleet_sizes):
+        if myModel.IsMIP:
+            # Once a fractional LP optimum has turned the model into a MIP,
+            # solve the remaining sizes together with shared presolve and cuts
+            results.extend(solve_fleet_scenarios(myModel, variables, fleet_constrs, fleet_sizes[k:]))
+            break
+        _set_fleet_size(myModel, variables, fleet_constrs, fs)
+        if basis is not None:
+            myModel.setAttr('VBasis', all_vars, basis[0])
+            myModel.setAttr('CBasis', all_constrs, basis[1])
+
+        # --- Solve ---
+        myModel.optimize()
+        _release_backlog_fixings(myModel)
+        _ensure_integral(myModel, variables)
+
+        if myModel.status == GRB.OPTIMAL and not myModel.IsMIP:
+            basis = (myModel.getAttr('VBasis', all_vars), myModel.getAttr('CBasis', all_constrs))
+        results.append(_collect_results(myModel, variables, verbose=False))
+    return results
+
+def solve_fleet_scenarios(myModel, variables, fleet_constrs, fleet_sizes):
+    """
+    Solves a model from build_model() for several fleet sizes in one optimize() call.
+    
+    Each fleet size becomes a Gurobi scenario that only overrides the RHS of
+    the FleetSize_* constraints, so presolve and the cut pool are shared.
+    This pays off once the model is a MIP (see _ensure_integral()); the
+    variables are switched to GRB.INTEGER here if they are not already.
+    
+    Returns:
+        list: One summary dict (without printing) per fleet size, or None for
+        scenarios that are infeasible.
+    """
+    y, H = variables["y"], variables["H"]
+
+    # Reduced costs are not available per scenario, so the H fixings from
+    # build_model() cannot be verified here; drop them up front
+    _release_backlog_fixings(myModel, force=True)
+    _make_integer(variables)
+
+    myModel.NumScenarios = len(fleet_sizes)
+    for k, fs in enumerate(fleet_sizes):
+        myModel.Params.ScenarioNumber = k
+        for c in fleet_constrs:
+            c.ScenNRHS = fs
+
+    # --- Solve ---
+    myModel.optimize()
+
+    results = []
+    for k in range(len(fleet_sizes)):
+        myModel.Params.ScenarioNumber = k
+        if myModel.status != GRB.OPTIMAL or myModel.ScenNObjVal >= GRB.INFINITY:
+            results.append(None)
+            continue
+        y_vals = myModel.getAttr('ScenNX', y)
+        backlog_days = sum(myModel.getAttr('ScenNX', H).values())
+        results.append({
+            "Total Cost": myModel.ScenNObjVal,
+            "Repo Cost": sum(COST_REPO[i,j] * v for (i,j,t), v in y_vals.items()),
+            "Hold Cost": COST_HOLD * backlog_days,
+            "Backlog Days": backlog_days
+        })
+
+    # Leave the model as a plain single-scenario model for later solves
+    myModel.NumScenarios = 0
+    return results
+
+def _make_integer(variables):
+    for name in ("x", "y", "I", "H"):
+        for var in variables[name].values():
+            var.VType = GRB.INTEGER
+
+def _is_integral(myModel, variables, tol=1e-6):
+    for name in ("x", "y", "I", "H"):
+        for v in myModel.getAttr('X', variables[name]).values():
+            if abs(v - round(v)) > tol:
+                return False
+    return True
+
+def _ensure_integral(myModel, variables):
+    """
+    Checks that the LP solution is integral (within 1e-6) and, if not,
+    switches the variables to GRB.INTEGER and re-solves as a MIP.
+    """
+    if myModel.status != GRB.OPTIMAL:
+        return
+    if _is_integral(myModel, variables):
+        return
+
+    # The H fixings were only verified for the LP, so drop them for the MIP
+    _release_backlog_fixings(myModel, force=True)
+    _make_integer(variables)
+    myModel.optimize()
+
+def _collect_results(myModel, variables, verbose):
+    if myModel.status != GRB.OPTIMAL:
+        if verbose:
+            print("Optimization was not successful.")
+        return None
 
+    # One getAttr call per block instead of one .X access per variable
+    x_vals = myModel.getAttr('X', variables["x"])
+    y_vals = myModel.getAttr('X', variables["y"])
+    I_vals = myModel.getAttr('X', variables["I"])
+    H_vals = myModel.getAttr('X', variables["H"])
+    return _report(myModel.objVal, x_vals, y_vals, I_vals, H_vals, myModel._demand, verbose)
+
+def _report(obj_val, x_vals, y_vals, I_vals, H_vals, demand, verbose):
+    """
+    Builds the summary metrics from solution values keyed like the Gurobi
+    variables ((i, j, t) or (i, t)) and optionally prints the schedule.
+    """
     # --- Output ---
-    if myModel.status == GRB.OPTIMAL:
-        repo_cost = obj_repo.getValue()
-        hold_cost = obj_hold.getValue()
-        total_shipped = sum(x[i,j,t].X for i,j in ROUTES for t in range(T))
-        total_backlog_days = sum(H[i,j,t].X for i,j in demand.keys() for t in range(T)) 
+    # Sum straight over the value dicts rather than re-indexing per key
+    repo_cost = sum(COST_REPO[i,j] * v for (i,j,t), v in y_vals.items())
+    total_shipped = sum(x_vals.values())
+    total_backlog_days = sum(H_vals.values())
+    hold_cost = COST_HOLD * total_backlog_days
+    
+    if verbose:
+        # Only the printed schedule needs pandas (~120 ms to import)
+        import pandas as pd
+
+        print(f"\nObjective Value: {obj_val}")
+        print("\n--- Weekly Schedule ---")
+        # Rows in day order, as in the weekly schedule
+        route_keys = [(i, j, t) for t in range(T) for i, j in ROUTES]
+        schedule = pd.DataFrame({
+            "Day": [DAYS[t] for _, _, t in route_keys],
+            "Origin": [i for i, _, _ in route_keys],
+            "Dest": [j for _, j, _ in route_keys],
+            "Loaded": [x_vals[k] for k in route_keys],
+            "Empty": [y_vals[k] for k in route_keys],
+            "Held": [H_vals.get(k, 0) for k in route_keys],
+        })
+        schedule = schedule[(schedule.Loaded > 0) | (schedule.Empty > 0) | (schedule.Held > 0)]
+        print(schedule.to_string(index=False, float_format="{:.0f}".format))
+
+        airport_keys = [(i, t) for t in range(T) for i in AIRPORTS]
+        idle = pd.DataFrame({
+            "Day": [DAYS[t] for _, t in airport_keys],
+            "Airport": [i for i, _ in airport_keys],
+            "Idle": [I_vals[k] for k in airport_keys],
+        })
+        idle = idle[idle.Idle > 0]
+        if not idle.empty:
+            print("\n--- Idle Aircraft ---")
+            print(idle.to_string(index=False, float_format="{:.0f}".format))
+
+        print("\n--- Summary Metrics ---")
+        print(f"Total Cost: {obj_val}")
+        print(f"Total Loaded Flights: {total_shipped}")
+        print(f"Repositioning Cost: {repo_cost}")
+        print(f"Holding Cost: {hold_cost}")
         
-        if verbose:
-            print(f"\nObjective Value: {myModel.objVal}")
-            print("\n--- Weekly Schedule ---")
-            print(f"{'Day':<5} {'Origin':<6} {'Dest':<6} {'Loaded':<8} {'Empty':<8} {'Held':<8}")
-            for t in range(T):
-                print(f"--- {DAYS[t]} ---")
-                for i, j in ROUTES:
-                    val_x = x[i, j, t].X
-                    val_y = y[i, j, t].X
-                    val_h = 0
-                    if (i, j) in demand:
-                        val_h = H[i, j, t].X
-                    if val_x > 0 or val_y > 0 or val_h > 0:
-                        print(f"{DAYS[t]:<5} {i:<6} {j:<6} {val_x:<8.0f} {val_y:<8.0f} {val_h:<8.0f}")
-                for i in AIRPORTS:
-                    val_i = I[i, t].X
-                    if val_i > 0:
-                         print(f"{DAYS[t]:<5} {i:<6} {'-':<6} {'-':<8} {'-':<8} {'-':<8} (Idle at {i}: {val_i:.0f})")
-
-            print("\n--- Summary Metrics ---")
-            print(f"Total Cost: {myModel.objVal}")
-            print(f"Total Loaded Flights: {total_shipped}")
-            print(f"Repositioning Cost: {repo_cost}")
-            print(f"Holding Cost: {hold_cost}")
-            
-        return {
-            "Total Cost": myModel.objVal,
-            "Repo Cost": repo_cost,
-            "Hold Cost": hold_cost,
-            "Backlog Days": total_backlog_days
-        }
-    else:
+    return {
+        "Total Cost": obj_val,
+        "Repo Cost": repo_cost,
+        "Hold Cost": hold_cost,
+        "Backlog Days": total_backlog_days
+    }
+
+def _assemble_coo(demand, fleet_size):
+    """
+    Assembles the equality constraints as COO triplets with NumPy broadcasting.
+    
+    Columns are laid out as x, y (ROUTES x T), I (AIRPORTS x T) and
+    H (demand routes x T), each block row-major in (route/airport, day).
+    Rows are the aircraft flow balance (AIRPORTS x T), cargo flow balance
+    (demand routes x T) and fleet size (T) constraints, in that order.
+    
+    Returns:
+        tuple: (rows, cols, data, b, col_offsets)
+    """
+    n_routes, n_airports, n_demand = len(ROUTES), len(AIRPORTS), len(demand)
+    demand_route = np.array([ROUTE_IDX[k] for k in demand], dtype=np.int32)
+    days, next_day = _DAYS_IDX, _NEXT_DAY
+    full_demand = DEMAND_ARR if demand is DEFAULT_DEMAND else demand_to_array(demand)
+    # (demand routes, T) loads, in the same order as the H columns
+    demand_arr = full_demand[_ROUTE_ORIG[demand_route], _ROUTE_DEST[demand_route]].astype(np.float64)
+
+    col_offsets = {"x": 0, "y": n_routes * T, "I": 2 * n_routes * T}
+    col_offsets["H"] = col_offsets["I"] + n_airports * T
+
+    route_cols, airport_cols = _ROUTE_COLS, _AIRPORT_COLS
+    demand_cols = np.add.outer(np.arange(n_demand, dtype=np.int32) * T, days)
+
+    flow_row0 = 0
+    cargo_row0 = n_airports * T
+    fleet_row0 = cargo_row0 + n_demand * T
+
+    blocks = []
+    def add(rows, cols, coef):
+        rows, cols = np.broadcast_arrays(rows, cols)
+        blocks.append((rows.ravel(), cols.ravel(), np.full(rows.size, coef, dtype=np.float64)))
+
+    # 1. Aircraft Flow Balance: a flight leaving on day t departs (-1) its
+    #    origin's row on t and arrives (+1) at its destination's row on t+1
+    for name in ("x", "y"):
+        cols = col_offsets[name] + route_cols
+        add(flow_row0 + _DEPART_ROWS, cols, -1)
+        add(flow_row0 + _ARRIVE_ROWS, cols, 1)
+    cols = col_offsets["I"] + airport_cols
+    add(flow_row0 + airport_cols, cols, -1)
+    add(flow_row0 + _IDLE_NEXT_ROWS, cols, 1)
+
+    # 2. Cargo Flow Balance: shipped + backlog_curr - backlog_prev == new_demand
+    cargo_rows = cargo_row0 + demand_cols
+    add(cargo_rows, col_offsets["x"] + route_cols[demand_route], 1)
+    add(cargo_rows, col_offsets["H"] + demand_cols, 1)
+    add(cargo_row0 + np.add.outer(np.arange(n_demand, dtype=np.int32) * T, next_day),
+        col_offsets["H"] + demand_cols, -1)
+
+    # 3. Fleet Size: everything in the air or on the ground on day t
+    for name, block_cols in (("x", route_cols), ("y", route_cols), ("I", airport_cols)):
+        add(fleet_row0 + days, col_offsets[name] + block_cols, 1)
+
+    rows = np.concatenate([b[0] for b in blocks]).astype(np.int32)
+    cols = np.concatenate([b[1] for b in blocks]).astype(np.int32)
+    data = np.concatenate([b[2] for b in blocks])
+    b = np.concatenate([
+        np.zeros(n_airports * T),
+        demand_arr.ravel(),
+        np.full(T, fleet_size, dtype=np.float64),
+    ])
+    return rows, cols, data, b, col_offsets
+
+def _column_keys(demand):
+    # Gurobi-style keys for each variable block, in _assemble_coo() column order
+    return {
+        "x": _ROUTE_DAY_KEYS,
+        "y": _ROUTE_DAY_KEYS,
+        "I": _AIRPORT_DAY_KEYS,
+        "H": [(i, j, t) for i, j in demand for t in range(T)],
+    }
+
+def _row_names(demand):
+    # Constraint names, in _assemble_coo() row order
+    return ([f"FlowBal_Air_{i}_{DAYS[t]}" for i in AIRPORTS for t in range(T)] +
+            [f"FlowBal_Cargo_{i}_{j}_{DAYS[t]}" for i, j in demand for t in range(T)] +
+            [f"FleetSize_{DAYS[t]}" for t in range(T)])
+
+def _build_matrix_problem(demand, fleet_size):
+    """
+    Builds the Cargo Operations model as `min c @ v  s.t.  A @ v == b, v >= 0`.
+    
+    Returns:
+        tuple: (c, A, b, col_offsets) with A as a scipy CSR matrix.
+    """
+    rows, cols, data, b, col_offsets = _assemble_coo(demand, fleet_size)
+    n_cols = col_offsets["H"] + len(demand) * T
+    A = sparse.csr_matrix((data, (rows, cols)), shape=(len(b), n_cols))
+
+    c = np.zeros(n_cols)
+    c[col_offsets["y"]:col_offsets["I"]] = np.repeat(_ROUTE_COST, T)
+    c[col_offsets["H"]:] = COST_HOLD
+    return c, A, b, col_offsets
+
+def build_highs_problem(demand=None, fleet_size=1200):
+    """
+    Builds the Cargo Operations LP in matrix form for scipy's HiGHS solvers.
+    
+    Returns:
+        tuple: (c, A_eq, b_eq, columns) where `columns` maps each variable
+        name to a dict from its Gurobi-style key to the column index.
+    """
+    demand = demand if demand else DEFAULT_DEMAND
+    c, A, b_eq, col_offsets = _build_matrix_problem(demand, fleet_size)
+
+    columns = {
+        name: {key: col_offsets[name] + k for k, key in enumerate(keys)}
+        for name, keys in _column_keys(demand).items()
+    }
+    return c, A.tocsc(), b_eq, columns
+
+def _solve_highs(fleet_size, demand, verbose):
+    # Only the optional HiGHS backend needs scipy.optimize (~160 ms to import)
+    from scipy.optimize import Bounds, LinearConstraint, linprog, milp
+
+    demand = demand if demand else DEFAULT_DEMAND
+    c, A_eq, b_eq, columns = build_highs_problem(demand, fleet_size)
+
+    res = linprog(c, A_eq=A_eq, b_eq=b_eq, bounds=(0, None), method='highs-ds')
+    if res.status == 0 and np.any(np.abs(res.x - np.round(res.x)) > 1e-6):
+        # Fractional LP vertex (see build_model): fall back to the MIP
+        res = milp(c, constraints=LinearConstraint(A_eq, b_eq, b_eq),
+                   integrality=np.ones_like(c), bounds=Bounds(0, np.inf))
+    if res.status != 0:
         if verbose:
             print("Optimization was not successful.")
         return None
 
+    # Plain floats, so results match the Gurobi backend's types
+    x_list = res.x.tolist()
+    vals = {name: {key: x_list[col] for key, col in cols.items()} for name, cols in columns.items()}
+    return _report(float(res.fun), vals["x"], vals["y"], vals["I"], vals["H"], demand, verbose)
+
+def solve_cargo_operations(fleet_size=1200, demand_override=None, verbose=True, threads=None, params=None,
+                           backend='gurobi'):
+    """
+    Solves the Cargo Operations problem.
+    
+    Args:
+        fleet_size (int): Total number of aircraft.
+        demand_override (dict): Optional replacement for DEFAULT_DEMAND.
+        verbose (bool): Whether to print solution details.
+        threads (int): Optional cap on Gurobi threads.
+        params (dict): Gurobi parameters overriding DEFAULT_PARAMS.
+        backend (str): 'gurobi' or 'highs' (scipy.optimize.linprog, no license or env needed).
+        
+    Returns:
+        dict: Summary metrics (Cost, RepoCost, HoldCost, TotalShipped, BacklogDays) or None if infeasible.
+    """
+    if backend == 'highs':
+        return _solve_highs(fleet_size, demand_override, verbose)
+    if backend != 'gurobi':
+        raise ValueError(f"Unknown backend: {backend!r}")
+    myModel, variables, fleet_constrs = build_model(demand_override, verbose, fleet_size, threads, params)
+    return solve_with_fleet(myModel, variables, fleet_constrs, fleet_size, verbose)
+
+def tune_cargo_model(path="cargo_tuned.prm", fleet_size=1200):
+    """
+    Runs the Gurobi tuning tool on the default instance and writes the best
+    parameter set found to `path`. Meant to be run offline, not per solve.
+    """
+    myModel, _, _ = build_model(verbose=False, fleet_size=fleet_size)
+    myModel.Params.TuneTimeLimit = 60
+    myModel.tune()
+    if myModel.TuneResultCount > 0:
+        myModel.getTuneResult(0)
+        myModel.write(path)
+
 if __name__ == "__main__":
     solve_cargo_operations(verbose=True)